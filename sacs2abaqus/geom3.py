@@ -3,6 +3,8 @@ from typing import Tuple
 
 
 class Vector3:
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         self.x = float(x)
         self.y = float(y)
@@ -15,7 +17,8 @@ class Vector3:
         return self / self.length()
 
     def length(self) -> float:
-        return math.sqrt(self.dot(self))
+        x, y, z = self.x, self.y, self.z
+        return math.sqrt(x * x + y * y + z * z)
 
     def dot(self, rhs: "Vector3") -> float:
         return self.x * rhs.x + self.y * rhs.y + self.z * rhs.z
@@ -49,7 +52,10 @@ class Vector3:
     def __truediv__(self, rhs: float) -> "Vector3":
         if not (isinstance(rhs, float) or isinstance(rhs, int)):
             return NotImplemented
-        return (1.0 / rhs) * self
+        # Scale directly rather than going through __rmul__ and __mul__, as this
+        # is called for every normalise
+        inv = 1.0 / rhs
+        return Vector3(self.x * inv, self.y * inv, self.z * inv)
 
     def __neg__(self) -> "Vector3":
         return Vector3(-self.x, -self.y, -self.z)
@@ -63,23 +69,47 @@ class Vector3:
         )
 
 
+# Global axes used when building beam coordinate systems. Vector3 operations
+# always return new instances, so these can be shared
+UNIT_Y = Vector3(0, 1, 0)
+UNIT_Z = Vector3(0, 0, 1)
+
+
 class CSys:
+    __slots__ = ("x", "y", "z")
+
     @staticmethod
-    def from_beam_ends(start: Vector3, end: Vector3) -> "CSys":
+    def from_beam_ends(start: Vector3, end: Vector3, angle: float = 0.0) -> "CSys":
+        # angle is an optional rotation about the beam axis in degrees, applied here
+        # rather than through rotated_about_x to avoid building a second CSys
         tol = 1e-6
         vec = end - start
         x = vec.normalise()
         if abs(abs(x.z) - 1) <= tol:
             # Vertical beam: local Z is in global Y
-            z = Vector3(0, 1, 0)
+            z = UNIT_Y
             y = z.cross(x).normalise()
         else:
             # Non-vertical beam: local Z is in the plane formed by the beam and the
             # global Z axis
-            z = Vector3(0, 0, 1)
-            y = z.cross(x).normalise()
+            y = UNIT_Z.cross(x).normalise()
             z = x.cross(y).normalise()
-        return CSys(x, y, z)
+        if angle:
+            rad_ang = math.radians(angle)
+            sin_theta = math.sin(rad_ang)
+            cos_theta = math.cos(rad_ang)
+            y, z = y * cos_theta + z * sin_theta, z * cos_theta - y * sin_theta
+        return CSys.from_unit_axes(x, y, z)
+
+    @staticmethod
+    def from_unit_axes(x: Vector3, y: Vector3, z: Vector3) -> "CSys":
+        # Builds a CSys from axes that are already unit length, skipping the
+        # normalisation done by __init__
+        csys = CSys.__new__(CSys)
+        csys.x = x
+        csys.y = y
+        csys.z = z
+        return csys
 
     def __init__(self, x: Vector3, y: Vector3, z: Vector3 = None):
         if z is None:
@@ -1,6 +1,5 @@
-import math
-
-from .geom3 import Vector3
+import re
+from functools import lru_cache
 
 # Maps of SACS section definitions to ABQ section definitions
 memberMap = {
@@ -19,26 +18,74 @@ memberMap = {
     "SBX": "BOX",  # Stiffened box section
 }
 
+# A "-" that follows a digit or decimal point is an exponent sign in SACS notation;
+# the sign of a negative number never does
+SACS_EXPONENT = re.compile(r"(?<=[\d.])-")
+
 
 def GetFloat(s):
     """
     Attempts to convert a string to a float. Returns False if there is an error
     """
+    # Blank fields are common, so catch them without raising an exception
+    if not s or s.isspace():
+        return False
+    try:
+        # Most fields are plain decimals, which float() handles directly
+        return float(s)
+    except ValueError:
+        pass
     try:
         # Handle scientific notation in SACS.
         # SACS records a number like 1.23e-2 as "1.23-2" so we need to replace
-        # the final "-" by "E-" for python to parse it correctly. Simply doing a
-        # string replace can fail in the case of a negative number, where both
-        # the negative sign for the number and the exponent will be replaced.
-        # Here we take the leading "-" off if it is present, do a string
-        # replacement and then merge them again.
-        s = s.strip()
-        prefix, s = ("-", s[1:]) if s.startswith('-') else ("", s)
-        s = prefix + s.replace("-", "E-")
-        return float(s)
+        # the exponent "-" by "E-" for python to parse it correctly, without
+        # touching the sign of a negative number (see SACS_EXPONENT)
+        return float(SACS_EXPONENT.sub("E-", s))
     except ValueError:
         return False
 
+
+def GetFloats(l, fields):
+    """
+    Converts a set of fixed-width fields of a SACS card to floats in one pass.
+    `fields` is a sequence of (start, end) column pairs; each field follows the
+    same rules as GetFloat
+    """
+    return [GetFloat(l[start:end]) for start, end in fields]
+
+
+@lru_cache(maxsize=None)
+def GetFixity(s):
+    """
+    Packs a SACS fixity code (6 characters, one per DOF) into an integer bitmask.
+    Bit i is set if DOF i + 1 is released ("1"); any other character is fixed.
+    There are only a handful of distinct codes in a model, so results are cached
+    """
+    return sum(1 << i for i, f in enumerate(s) if f == "1")
+
+
+def PlateJointsCrossed(j1, j2, j3, j4):
+    """
+    Given the 4 joints of a plate (anything with x, y, z attributes), returns True
+    if joints 3 and 4 need to be swapped so that the plate does not self-intersect.
+    Works on plain floats so nothing is allocated per plate
+    """
+    x1, y1, z1 = j1.x, j1.y, j1.z
+    # Edge from j1 to j2, and the vectors from j1 to j3 and j4
+    lx, ly, lz = j2.x - x1, j2.y - y1, j2.z - z1
+    ax, ay, az = j3.x - x1, j3.y - y1, j3.z - z1
+    bx, by, bz = j4.x - x1, j4.y - y1, j4.z - z1
+    # j3 is at the larger angle from the edge if cos3 < cos4, i.e.
+    # a.l / |a| < b.l / |b|. Multiplying through by |a||b| and then applying
+    # t -> t|t|, which keeps the order, gives a test with no square roots or
+    # divisions
+    a_dot = lx * ax + ly * ay + lz * az
+    b_dot = lx * bx + ly * by + lz * bz
+    a_sq = ax * ax + ay * ay + az * az
+    b_sq = bx * bx + by * by + bz * bz
+    return a_dot * abs(a_dot) * b_sq < b_dot * abs(b_dot) * a_sq
+
+
 def OrderJoints(jlist):
     """
     Given 4 joint instances, returns the joint ABQIDs in order such that they
@@ -46,11 +93,7 @@ def OrderJoints(jlist):
     This is done in a way that retains the local coordinate system of the plate,
     which is defined by the joint ordering
     """
-    j1, j2, j3, j4 = [Vector3(j.x, j.y, j.z) for j in jlist]
-    local_x = (j2 - j1).normalise()
-    # Calculate the angle between the (j1 to j2) and (j1 to j3)
-    j3_ang = math.acos(local_x.dot(j3 - j1) / (j3 - j1).length())
-    j4_ang = math.acos(local_x.dot(j4 - j1) / (j4 - j1).length())
-    if j3_ang > j4_ang:
-        return [jlist[i] for i in [0, 1, 3, 2]]
-    return list(jlist)
+    j1, j2, j3, j4 = jlist
+    if PlateJointsCrossed(j1, j2, j3, j4):
+        return [j1, j2, j4, j3]
+    return [j1, j2, j3, j4]
@@ -3,6 +3,10 @@ from collections.abc import Sequence
 
 Point = tuple[float, float, float]
 
+# Constant fields of the two directory entry lines written by Iges.entity
+DIRECTORY_ZEROS_1 = "{:8d}".format(0) * 6
+DIRECTORY_ZEROS_2 = "{:8d}{:8d}{:8d}{:8d}{:8d}{:8d}".format(1, 0, 1, 0, 0, 0)
+
 
 def hollerith(s: str) -> str:
     return "{}H{}".format(len(s), s)
@@ -16,21 +20,25 @@ class Iges:
     def add_line(self, section: str, line: str, index: int = None) -> None:
         self.lineno[section] += 1
         lineno = self.lineno[section]
-        buf = "{:64s}{:>8s}{}{:7d}\n".format(line, str(index or ""), section, lineno)
-        self.buffer[section].append(buf)
+        self.buffer[section].append(
+            f"{line:64s}{str(index or ''):>8s}{section}{lineno:7d}\n"
+        )
 
     def update(self, section: str, params: Sequence, index: int = None):
         params = [str(p) for p in params]
-        lines = [params[0]]
+        # Gather the parameters for each line and join them once the line is full,
+        # tracking the joined length rather than rebuilding the string per parameter
+        line = [params[0]]
+        length = len(params[0])
         for p in params[1:]:
-            if len(lines[-1] + p) + 1 < 64:
-                lines[-1] += "," + p
+            if length + len(p) + 1 < 64:
+                line.append(p)
+                length += len(p) + 1
             else:
-                lines[-1] += ","
-                lines.append(p)
-        for line in lines[:-1]:
-            self.add_line(section, line + ",", index=index)
-        self.add_line(section, lines[-1] + ";", index=index)
+                self.add_line(section, ",".join(line) + ",", index=index)
+                line = [p]
+                length = len(p)
+        self.add_line(section, ",".join(line) + ";", index=index)
 
     def start_section(self, comment: str = None):
         comment = comment or ""
@@ -78,15 +86,11 @@ class Iges:
         status = "00010001" if child else "1"
         dline = self.lineno["D"] + 1
         pline = self.lineno["P"] + 1
+        # The zero and one fields are constant, so only the varying fields are
+        # formatted
         self.buffer["D"].append(
-            "{:>8d}{:8d}{:8d}{:8d}{:8d}{:8d}{:8d}{:8d}{:>8s}D{:7d}\n".format(
-                code, pline, 0, 0, 0, 0, 0, 0, status, dline
-            )
-        )
-        self.buffer["D"].append(
-            "{:>8d}{:8d}{:8d}{:8d}{:8d}{:8d}{:8d}{:8s}{:8d}D{:7d}\n".format(
-                code, 1, 0, 1, 0, 0, 0, label, 0, dline + 1
-            )
+            f"{code:>8d}{pline:8d}{DIRECTORY_ZEROS_1}{status:>8s}D{dline:7d}\n"
+            f"{code:>8d}{DIRECTORY_ZEROS_2}{label:8s}       0D{dline + 1:7d}\n"
         )
         self.update("P", [code] + list(params), index=dline)
         self.lineno["D"] = dline + 1
@@ -131,10 +135,10 @@ class Iges:
         else:
             outputHandle = open(filename, "wt")
         with outputHandle as f:
-            f.write("".join(self.buffer["S"]))
-            f.write("".join(self.buffer["G"]))
-            f.write("".join(self.buffer["D"]))
-            f.write("".join(self.buffer["P"]))
+            # writelines hands the records to the file's buffer as they are, so
+            # the sections are not copied into a second, joined string first
+            for section in "SGDP":
+                f.writelines(self.buffer[section])
             f.write(
                 "S{:7d}G{:7d}D{:7d}P{:7d}{:40s}T{:7d}\n".format(
                     self.lineno["S"],
@@ -1,15 +1,20 @@
 import logging
+from collections import defaultdict
+from operator import attrgetter
 
-from .helpers import OrderJoints
+from .helpers import PlateJointsCrossed
 from .geom3 import CSys, Vector3
 from .sacs_cards import SacsStructure
 
 BEAM_TYPE = "B31"
+# Output files are written in large blocks, so give them a larger buffer than
+# the default to cut down on the number of system calls
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def write_abaqus_input(stru: SacsStructure, outfile_name: str, write_secondary: bool):
     print("\nGenerating orphan mesh:")
-    with open(outfile_name, "w") as out:
+    with open(outfile_name, "w", buffering=WRITE_BUFFER_SIZE) as out:
         print("\tWriting nodes to input file...")
         write_nodes(stru, out)
         print("\tWriting elements to input file...")
@@ -37,179 +42,176 @@ def write_abaqus_input(stru: SacsStructure, outfile_name: str, write_secondary:
 
 
 def write_nodes(stru: SacsStructure, out):
-    out.write("*Node, nset=N-AllNodes\n")
-    for j in sorted(stru.joints.keys()):
-        out.write(
-            "{}, {}, {}, {}\n".format(
-                stru.joints[j].ABQID,
-                stru.joints[j].x,
-                stru.joints[j].y,
-                stru.joints[j].z,
-            )
+    # Joints are numbered in the order they are read, so this is close to sorted
+    # already and is cheap to sort
+    out.write(
+        "*Node, nset=N-AllNodes\n"
+        + "".join(
+            f"{j.ABQID}, {j.x}, {j.y}, {j.z}\n"
+            for j in sorted(stru.joints.values(), key=attrgetter("ABQID"))
         )
+    )
 
 
 def write_elements(stru: SacsStructure, out):
+    joints = stru.joints
+    # Bucket members and plates by group in a single pass so that each group's
+    # elements can be emitted without rescanning every element
+    group_members = defaultdict(list)
+    for m in stru.members.values():
+        group_members[m.group].append(m)
+    group_plates = defaultdict(list)
+    for p in stru.plates.values():
+        group_plates[p.group].append(p)
     elnum = 1
-    for g in stru.grups:
-        out.write(
-            "*Element, type={}, elset=MG-{}\n".format(BEAM_TYPE, g.replace(".", "-"))
-        )
-        for m in stru.members:
-            if stru.members[m].group == g:
-                stru.members[m].ABQID = elnum
-                out.write(
-                    "{}, {}, {}\n".format(
-                        stru.members[m].ABQID,
-                        stru.joints[stru.members[m].jointA].ABQID,
-                        stru.joints[stru.members[m].jointB].ABQID,
-                    )
+    # Each group's block of elements is built up and written in one go
+    for g, grup in stru.grups.items():
+        chunks = ["*Element, type={}, elset=MG-{}\n".format(BEAM_TYPE, grup.abq_name)]
+        for m in group_members.get(g, ()):
+            m.ABQID = elnum
+            chunks.append(
+                f"{elnum}, {joints[m.jointA].ABQID}, {joints[m.jointB].ABQID}\n"
+            )
+            elnum += 1
+        out.write("".join(chunks))
+    for pg, pgrup in stru.pgrups.items():
+        chunks = []
+        for p in group_plates.get(pg, ()):
+            p.ABQID = elnum
+            if p.jointD == "":
+                # 3-element shell
+                chunks.append("*Element, type=S3, elset=PG-{}\n".format(pgrup.abq_name))
+                chunks.append(
+                    f"{elnum}, {joints[p.jointA].ABQID}, {joints[p.jointB].ABQID}, "
+                    f"{joints[p.jointC].ABQID}\n"
                 )
-                elnum += 1
-    for pg in stru.pgrups:
-        for p in stru.plates:
-            if stru.plates[p].group == pg:
-                stru.plates[p].ABQID = elnum
-                if stru.plates[p].jointD == "":
-                    # 3-element shell
-                    out.write(
-                        "*Element, type=S3, elset=PG-{}\n".format(pg.replace(".", "-"))
-                    )
-                    out.write(
-                        "{}, {}, {}, {}\n".format(
-                            stru.plates[p].ABQID,
-                            stru.joints[stru.plates[p].jointA].ABQID,
-                            stru.joints[stru.plates[p].jointB].ABQID,
-                            stru.joints[stru.plates[p].jointC].ABQID,
-                        )
-                    )
-                else:
-                    # 4-element shell
-                    out.write(
-                        "*Element, type=S4R, elset=PG-{}\n".format(pg.replace(".", "-"))
-                    )
-                    # Sometimes the order of joints in SACS results in a self-intersecting
-                    # element in Abaqus. Try to fix this assuming all plates are roughly
-                    # rectangular and checking that the next node defined is never the furthest away
-                    j1 = stru.joints[stru.plates[p].jointA]
-                    j2 = stru.joints[stru.plates[p].jointB]
-                    j3 = stru.joints[stru.plates[p].jointC]
-                    j4 = stru.joints[stru.plates[p].jointD]
-                    j1, j2, j3, j4 = OrderJoints([j1, j2, j3, j4])
-                    out.write(
-                        "{}, {}, {}, {}, {}\n".format(
-                            elnum, j1.ABQID, j2.ABQID, j3.ABQID, j4.ABQID
-                        )
-                    )
-                elnum += 1
+            else:
+                # 4-element shell
+                chunks.append(
+                    "*Element, type=S4R, elset=PG-{}\n".format(pgrup.abq_name)
+                )
+                # Sometimes the order of joints in SACS results in a self-intersecting
+                # element in Abaqus. Try to fix this assuming all plates are roughly
+                # rectangular and checking that the next node defined is never the furthest away
+                j1 = joints[p.jointA]
+                j2 = joints[p.jointB]
+                j3 = joints[p.jointC]
+                j4 = joints[p.jointD]
+                if PlateJointsCrossed(j1, j2, j3, j4):
+                    j3, j4 = j4, j3
+                chunks.append(
+                    f"{elnum}, {j1.ABQID}, {j2.ABQID}, {j3.ABQID}, {j4.ABQID}\n"
+                )
+            elnum += 1
+        out.write("".join(chunks))
 
 
 def write_sets(stru: SacsStructure, out):
-    out.write("****MEMBER ELEMENT SETS****\n")
-    for m in stru.members:
-        out.write(
-            "*Elset, elset=M-{}\n{}\n".format(
-                stru.members[m].ID.replace(".", "-"), stru.members[m].ABQID
-            )
+    out.write(
+        "****MEMBER ELEMENT SETS****\n"
+        + "".join(
+            f"*Elset, elset=M-{m.abq_name}\n{m.ABQID}\n" for m in stru.members.values()
         )
-    out.write("****PLATE ELEMENT SETS****\n")
-    for p in stru.plates:
-        out.write(
-            "*Elset, elset=P-{}\n{}\n".format(
-                stru.plates[p].ID.replace(".", "-"), stru.plates[p].ABQID
+    )
+    out.write(
+        "****PLATE ELEMENT SETS****\n"
+        + "".join(
+            f"*Elset, elset=P-{p.abq_name}\n{p.ABQID}\n" for p in stru.plates.values()
+        )
+    )
+
+
+def _group_section_template(stru: SacsStructure, g: str):
+    """
+    Works out once how the members of group g are given a beam section. Returns a
+    (template, warning) pair: template is a (header, data) pair where header has a {}
+    placeholder for the member's Abaqus name and data is the rendered section
+    definition shared by every member of the group. template is None if no section
+    can be assigned, in which case warning (if any) describes why
+    """
+    grup = stru.grups[g]
+    if grup.section:
+        # This group uses a section definition: get values from that
+        s = stru.sects.get(grup.section)
+        if s is None:
+            # This occurs if a SECT is specified in the GRUP, but there
+            # is no corresponding SECT definition in the SACS file
+            return None, None
+        if s.sect in ["CON"]:
+            return (
+                None,
+                "Members in group {} are assigned CON section; skipping\n".format(g),
             )
+        elif s.sect in ["PIPE", "I", "TEE", "L", "CHL", "ARBITRARY", "BOX"]:
+            return s.abaqus_section_template(), None
+        else:
+            return None, "Unknown section assignment in group {}, skipping\n.".format(g)
+    # This group defines its owns sects without a discrete SECT line
+    if grup.OD == 0.0:
+        return None, (
+            "Unable to determine section properties for group {}, skipping.".format(g)
         )
+    # Pipe. Abaqus requires input of outside radii, whereas SACS is in OD
+    # outside radius, wall thickness
+    header = "*Beam Section, elset=M-{}, section=PIPE, material=Mtl-Beam\n"
+    return (header, "{}, {}\n".format(grup.OD / 2, grup.thickness)), None
 
 
 def write_beam_sections(stru: SacsStructure, out):
-    out.write("**\n** BEAM SECTIONS **\n")
+    chunks = ["**\n** BEAM SECTIONS **\n"]
     # Have to assign sections to individual members, not groups, as we can not
     # guarentee that all members in a group are vertical or non-vertical, so
-    # can't give a blanket orientation assignment
-    for m in stru.members:
-        g = stru.members[m].group
+    # can't give a blanket orientation assignment. The section itself is only
+    # resolved once per group though.
+    grups = stru.grups
+    joints = stru.joints
+    section_templates = {}
+    for m, mem in stru.members.items():
+        g = mem.group
         assigned = False
-        if g in stru.grups:
-            if stru.grups[g].section:
-                # This group uses a section definition: get values from that
-                try:
-                    s = stru.sects[stru.grups[g].section]
-                except KeyError:
-                    # This occurs if a SECT is specified in the GRUP, but there
-                    # is no corresponding SECT definition in the SACS file, so
-                    # use the section properties from the GRUP line instead.
-                    s = ""
-                except Exception as e:
-                    # Unexpected error, log
-                    logging.error(
-                        "ERROR: {} when trying to use section of GROUP: {}".format(e, g)
-                    )
-                if s:
-                    if s.sect in ["CON"]:
-                        logging.warning(
-                            "Members in group {} are assigned CON section; skipping\n".format(
-                                g
-                            )
-                        )
-                    elif s.sect in ["PIPE", "I", "TEE", "L", "CHL", "ARBITRARY", "BOX"]:
-                        out.write(s.abaqus_section_defn(m))
-                        assigned = True
-                    else:
-                        logging.warning(
-                            "Unknown section assignment in group {}, skipping\n.".format(
-                                g
-                            )
-                        )
-            else:
-                # This group defines its owns sects without a discrete SECT line
-                if stru.grups[g].OD != 0.0:
-                    # Pipe
-                    out.write(
-                        "*Beam Section, elset=M-{}, section={}, material=Mtl-Beam\n".format(
-                            m.replace(".", "-"), "PIPE"
-                        )
-                    )
-                    # Abaqus requires input of outside radii, whereas SACS is in OD
-                    out.write(
-                        "{}, {}\n".format(stru.grups[g].OD / 2, stru.grups[g].thickness)
-                    )  # outside radius, wall thickness
-                    assigned = True
-                else:
-                    logging.warning(
-                        "Unable to determine section properties for group {}, skipping.".format(
-                            g
-                        )
-                    )
+        if g in grups:
+            if g not in section_templates:
+                section_templates[g] = _group_section_template(stru, g)
+            template, warning = section_templates[g]
+            if template is not None:
+                header, data = template
+                chunks.append(header.format(mem.abq_name))
+                chunks.append(data)
+                assigned = True
+            elif warning:
+                logging.warning(warning)
         else:
             # Member group not found, report as error
-            stru.missing_sect_members.append(m)
             logging.warning(
                 "No group definition found for member {}, no section can be assigned!".format(
-                    m.replace(".", "-")
+                    mem.abq_name
                 )
             )
         if assigned:
-            beam_csys = stru.members[m].local_csys(stru.joints)
+            beam_csys = mem.local_csys(joints)
             local_z = beam_csys.y
-            out.write("{}, {}, {}\n".format(*local_z.as_tuple()))
+            chunks.append(f"{local_z.x}, {local_z.y}, {local_z.z}\n")
         else:
-            try:
-                stru.missing_sect_members.append(m)
+            # Each member is classified as missing exactly once, here
+            stru.missing_sect_members.append(m)
+            if g in grups:
                 logging.warning(
                     "Missing section assignment for member {} (Group {}, Section ID {})\n".format(
-                        m.replace(".", "-"),
-                        stru.members[m].group,
-                        stru.grups[g].section,
+                        mem.abq_name,
+                        mem.group,
+                        grups[g].section,
                     )
                 )
-            except Exception as e:
-                logging.error("** Unhandled error for group {}: {}\n".format(g, e))
-    out.write("*Material, name=Mtl-Beam\n*Density\n7850.,\n*Elastic\n2e+11, 0.3\n")
+    chunks.append("*Material, name=Mtl-Beam\n*Density\n7850.,\n*Elastic\n2e+11, 0.3\n")
 
     if stru.missing_sect_members:
-        out.write("*Elset, elset=ErrMissingSections\n")
-        for m in stru.missing_sect_members:
-            out.write("M-{}\n".format(m))
+        chunks.append("*Elset, elset=ErrMissingSections\n")
+        # Refer to the members' element sets by the same names write_sets gave them
+        chunks.extend(
+            f"M-{stru.members[m].abq_name}\n" for m in stru.missing_sect_members
+        )
+    out.write("".join(chunks))
+    if stru.missing_sect_members:
         print(
             "\n**NOTE: {} members have sections not defined in the SACS or Library files. These are added to sets ErrMissingSections\n".format(
                 len(stru.missing_sect_members)
@@ -218,74 +220,86 @@ def write_beam_sections(stru: SacsStructure, out):
 
 
 def write_plate_sections(stru: SacsStructure, out):
-    out.write("**\n** PLATE SECTIONS **\n")
-    for pg in stru.pgrups:
-        out.write(
-            "*Shell General Section, elset=PG-{}, material={}\n".format(
-                stru.pgrups[pg].ID.replace(".", "-"), "Mtl-Plate"
+    chunks = ["**\n** PLATE SECTIONS **\n"]
+    for pgrup in stru.pgrups.values():
+        chunks.append(
+            "*Shell General Section, elset=PG-{}, material={}\n{}\n".format(
+                pgrup.abq_name, "Mtl-Plate", pgrup.thickness
             )
         )
-        out.write("{}\n".format(stru.pgrups[pg].thickness))
-    out.write("*Material, name=Mtl-Plate\n*Density\n7850.,\n*Elastic\n2e+11, 0.3\n")
+    chunks.append("*Material, name=Mtl-Plate\n*Density\n7850.,\n*Elastic\n2e+11, 0.3\n")
+    out.write("".join(chunks))
 
 
 def write_node_map(stru, filename: str):
-    with open(filename, "w") as out:
+    with open(filename, "w", buffering=WRITE_BUFFER_SIZE) as out:
         out.write("ABQ\t->\tSACS\n")
-        for nodes in stru.nmap:
-            out.write("\t->\t".join([str(node) for node in nodes]) + "\n")
+        out.write(
+            "".join(f"{abq_id}\t->\t{sacs_id}\n" for abq_id, sacs_id in stru.nmap)
+        )
+        # Joints merged away by merge_small_members are listed after the rest
+        out.write(
+            "".join(
+                f"{abq_id}\t->\t{sacs_id}\t->\t{note}\n"
+                for abq_id, sacs_id, note in stru.nmap_merged
+            )
+        )
 
 
 def write_element_map(stru, filename: str):
-    with open(filename, "w") as out:
+    with open(filename, "w", buffering=WRITE_BUFFER_SIZE) as out:
         out.write("ABQ\t->\tSACS\n")
-        elmap = [(mem.ABQID, mem_name) for mem_name, mem in stru.members.items()]
-        for e in sorted(elmap):
-            out.write("{}\t->\t{}\n".format(e[0], e[1]))
+        out.write(
+            "".join(
+                f"{mem.ABQID}\t->\t{mem.ID}\n"
+                for mem in sorted(stru.members.values(), key=attrgetter("ABQID", "ID"))
+            )
+        )
+
+
+def _cload_lines(abq_id: int, load) -> str:
+    # The six *Cload data lines for a joint load, one per DOF, as a single string
+    fx, fy, fz, mx, my, mz = load
+    return (
+        f"{abq_id}, 1, {fx}\n{abq_id}, 2, {fy}\n{abq_id}, 3, {fz}\n"
+        f"{abq_id}, 4, {mx}\n{abq_id}, 5, {my}\n{abq_id}, 6, {mz}\n"
+    )
 
 
 def write_loads(stru: SacsStructure, filename: str):
-    with open(filename, "w") as out:
+    with open(filename, "w", buffering=WRITE_BUFFER_SIZE) as out:
         out.write("** INDIVIDUAL LOAD CASES **\n**\n")
-        for lc in stru.loadcases:
-            out.write(
-                "**\n** LOAD CASE {}\n** {}\n**\n".format(
-                    lc, stru.loadcases[lc].description
-                )
-            )
-            if stru.loadcases[lc].loads:
-                out.write("*Cload\n")
-            for l in stru.loadcases[lc].loads:
+        joints = stru.joints
+        for lc, case in stru.loadcases.items():
+            chunks = ["**\n** LOAD CASE {}\n** {}\n**\n".format(lc, case.description)]
+            if case.loads:
+                chunks.append("*Cload\n")
+            for l in case.loads:
                 if l.type != "joint":
                     continue
-                for d in range(6):
-                    out.write(
-                        "{}, {}, {}\n".format(
-                            stru.joints[l.joint].ABQID, d + 1, l.load[d]
-                        )
-                    )
-            out.write("*" * 80 + "\n")
+                abq_id = joints[l.joint].ABQID
+                chunks.append(_cload_lines(abq_id, l.load))
+            chunks.append("*" * 80 + "\n")
+            out.write("".join(chunks))
         out.write("** COMBINATION LOAD CASES **\n**\n")
-        for lcm in stru.lcombs:
-            loadset = {}
-            for lc in stru.lcombs[lcm].loadcases:
-                if lc[0] in stru.loadcases:
-                    for l in stru.loadcases[lc[0]].loads:
-                        if l.type != "joint":
-                            continue
-                        j = l.joint
-                        if not j in loadset:
-                            loadset[j] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-                        for i in range(6):
-                            loadset[j][i] += l.load[i] * lc[1]
+        # Only joint loads are combined; gather them once per load case rather
+        # than filtering every time the case appears in a combination
+        joint_loads = {
+            name: [(l.joint, l.load) for l in case.loads if l.type == "joint"]
+            for name, case in stru.loadcases.items()
+        }
+        for lcm, lcomb in stru.lcombs.items():
+            loadset = defaultdict(lambda: (0.0,) * 6)
+            for lc, factor in lcomb.loadcases:
+                for j, load in joint_loads.get(lc, ()):
+                    # Accumulate all 6 components of the scaled load at once
+                    loadset[j] = [
+                        total + component * factor
+                        for total, component in zip(loadset[j], load)
+                    ]
             if loadset:
-                out.write("*** COMBINATION LOAD CASE {} ***\n".format(lcm))
-                out.write("*Cload\n")
-                for jl in loadset:
-                    for i in range(6):
-                        out.write(
-                            "{}, {}, {}\n".format(
-                                stru.joints[jl].ABQID, i + 1, loadset[jl][i]
-                            )
-                        )
-                out.write("*" * 80 + "\n")
+                chunks = ["*** COMBINATION LOAD CASE {} ***\n*Cload\n".format(lcm)]
+                for jl, totals in loadset.items():
+                    chunks.append(_cload_lines(joints[jl].ABQID, totals))
+                chunks.append("*" * 80 + "\n")
+                out.write("".join(chunks))
@@ -1,28 +1,58 @@
 import math
-import json
 from collections import defaultdict
 from abaqusConstants import *
 import regionToolset
 
+try:
+    # orjson parses the intermediate file much faster, but is rarely installed in
+    # the Abaqus python environment
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 OFFSET_TO_TOS = {offset_to_tos}
 GRAVITY = 9.80665
 
 
 def _index_list_to_seq(geom_seq, idxs):
-    seq = geom_seq[idxs[0] : idxs[0] + 1]
-    for idx in idxs[1:]:
-        seq += geom_seq[idx : idx + 1]
-    return seq
+    # Select all the items in one call from a mask, in the same form getMask
+    # returns: hex 32 bit words, lowest indices first
+    words = [0] * (max(idxs) // 32 + 1)
+    for idx in idxs:
+        words[idx // 32] |= 1 << (idx % 32)
+    mask = "[{{}} ]".format(" ".join("#{{:x}}".format(w) for w in words))
+    return geom_seq.getSequenceFromMask(mask=(mask,))
+
+
+def _get_edge_ends(vertices, edge):
+    v0, v1 = edge.getVertices()
+    return vertices[v0].pointOn[0], vertices[v1].pointOn[0]
+
+
+def _get_stringer_map(part):
+    # Map each stringer edge index to the name of the first stringer containing it
+    stringer_map = dict()
+    for stringer_name, stringer in part.stringers.items():
+        for e in stringer.edges:
+            stringer_map.setdefault(e.index, stringer_name)
+    return stringer_map
+
 
+def _get_member_lines(members):
+    # End points of each member, and the mid points used to find its edge
+    lines = [(m["jointA"]["position"], m["jointB"]["position"]) for m in members]
+    mid_points = [
+        [(a[0] + b[0]) / 2, (a[1] + b[1]) / 2, (a[2] + b[2]) / 2] for a, b in lines
+    ]
+    return lines, mid_points
 
-def _get_edge_ends(part, edge):
-    verts_idxs = edge.getVertices()
-    verts = [part.vertices[v] for v in verts_idxs]
-    return [v.pointOn[0] for v in verts]
+
+def _vector(start, end):
+    return (end[0] - start[0], end[1] - start[1], end[2] - start[2])
 
 
 def _dot(a, b):
-    return sum([i * j for i, j in zip(a, b)])
+    return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
 
 
 def _length(v):
@@ -40,35 +70,37 @@ def _flip_normals(part, data):
         normal = face.getNormal()
         if _dot(normal, plate["local_z"]) < 0:
             to_flip.append(face.index)
-    part.flipNormal(
-        regions=regionToolset.Region(faces=_index_list_to_seq(part.faces, to_flip))
-    )
+    if to_flip:
+        part.flipNormal(
+            regions=regionToolset.Region(faces=_index_list_to_seq(part.faces, to_flip))
+        )
     print("Flipped {{}} faces".format(len(to_flip)))
 
 
-def _generate_wires(part, data):
-    lines = [
-        (m["jointA"]["position"], m["jointB"]["position"])
-        for m in data["members"].values()
-    ]
-    mid_points = [([(i + j) / 2 for i, j in zip(start, end)]) for start, end in lines]
-    # Find all plate edges that are near one of our beams
-    edges = part.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
-    # Any edges that we found indicate stringers, only create wires where we dont
-    # have a stringer
-    non_stringer_idxs = [i for i in range(len(lines)) if i not in edges]
-    # Create stringers for all edges that we found
-    num_stringers = 0
-    for i in edges:
-        edge, pt = edges[i]
+def _generate_wires(part, lines, mid_points):
+    # Find all plate edges that are near one of our beams. Without any plates
+    # there are no edges yet, so skip the search
+    if len(part.faces) == 0:
+        edges = {{}}
+    else:
+        edges = part.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
+    # Create stringers for all edges that we found, once per edge even where
+    # several beams lie on the same plate edge
+    stringer_edges = set()
+    part_edges = part.edges
+    Stringer = part.Stringer
+    for edge, pt in edges.values():
         assert len(edge.getFaces()) > 0
-        num_stringers += 1
-        edge_seq = part.edges[edge.index : edge.index + 1]
+        if edge.index in stringer_edges:
+            continue
+        stringer_edges.add(edge.index)
+        edge_seq = part_edges[edge.index : edge.index + 1]
         # Create stringer
-        part.Stringer(edges=edge_seq, name="Stringer-{{}}".format(num_stringers))
-    # Create wires for the non-stringer beam elements
+        Stringer(edges=edge_seq, name="Stringer-{{}}".format(len(stringer_edges)))
+    # Any edges that we found indicate stringers, only create wires where we dont
+    # have a stringer
     part.WirePolyLine(
-        points=[lines[i] for i in non_stringer_idxs],
+        points=[line for i, line in enumerate(lines) if i not in edges],
         mergeType=SEPARATE,
         meshable=ON,
     )
@@ -76,15 +108,9 @@ def _generate_wires(part, data):
 
 # region SECTION_BUILDERS
 def _make_BOX_section(model, name, sect):
-    model.BoxProfile(
-        name=name,
-        b=sect["h"],
-        a=sect["b"],
-        t1=sect["tw"],
-        t2=sect["tf"],
-        t3=sect["tw"],
-        t4="tf",
-    )
+    tw = sect["tw"]
+    tf = sect["tf"]
+    model.BoxProfile(name=name, b=sect["h"], a=sect["bf"], t1=tw, t2=tf, t3=tw, t4=tf)
 
 
 def _make_PIPE_section(model, name, sect):
@@ -100,10 +126,11 @@ def _make_TAPER_PIPE_section(model, name, sect):
 
 
 def _make_I_section(model, name, sect):
+    h = sect["h"]
     model.IProfile(
         name=name,
-        l=sect["h"] if OFFSET_TO_TOS else sect["offset"],
-        h=sect["h"],
+        l=h if OFFSET_TO_TOS else sect["offset"],
+        h=h,
         b1=sect["bf_bot"],
         b2=sect["bf_top"],
         t1=sect["tf_bot"],
@@ -190,6 +217,19 @@ def _make_ARBITRARY_section(model, name, sect):
 
 # endregion
 
+# fmt: off
+SECTION_BUILDERS = {{
+    "PIPE": _make_PIPE_section,
+    "TAPER_PIPE": _make_TAPER_PIPE_section,
+    "I": _make_I_section,
+    "TEE": _make_TEE_section,
+    "L": _make_L_section,
+    "CHL": _make_CHL_section,
+    "ARBITRARY": _make_ARBITRARY_section,
+    "BOX": _make_BOX_section,
+}}
+# fmt: on
+
 
 def _generate_materials(model, data):
     for name, props in data["materials"].items():
@@ -201,30 +241,19 @@ def _generate_materials(model, data):
 
 
 def _generate_sections(model, data):
-    # fmt: off
-    FUNCTION_MAP = {{
-            "PIPE": _make_PIPE_section,
-            "TAPER_PIPE": _make_TAPER_PIPE_section,
-            "I": _make_I_section,
-            "TEE": _make_TEE_section,
-            "L": _make_L_section,
-            "CHL": _make_CHL_section,
-            "ARBITRARY": _make_ARBITRARY_section,
-            "BOX": _make_BOX_section,
-    }}
-    # fmt: on
     # Find all the unique pairs of section and material
-    materials = defaultdict(list)
+    materials = defaultdict(set)
     for mem in data["members"].values():
-        materials[mem["section"]].append(mem["material"])
+        materials[mem["section"]].add(mem["material"])
+    BeamSection = model.BeamSection
     # Loop through the incoming profiles and create the profile and section
     for name, sect in data["profiles"].items():
         name = str(name)
-        FUNCTION_MAP[sect["type"]](model, name, sect)
+        SECTION_BUILDERS[sect["type"]](model, name, sect)
         # TODO: Pass the correct material
         for mat in materials[name]:
             mat = str(mat)
-            model.BeamSection(
+            BeamSection(
                 name="{{}}_{{}}".format(name, mat),
                 integration=DURING_ANALYSIS,
                 poissonRatio=0.0,
@@ -235,38 +264,26 @@ def _generate_sections(model, data):
             )
 
 
-def _assign_sections(part, data):
-    members = list(data["members"].values())
-    lines = [(m["jointA"]["position"], m["jointB"]["position"]) for m in members]
-    mid_points = [([(i + j) / 2 for i, j in zip(start, end)]) for start, end in lines]
-    edges = part.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
+def _assign_sections(part, members, edges):
     # Gather all edges/stringers that need to be assigned a given section
     edge_assignments = defaultdict(list)
     stringer_assignments = defaultdict(list)
     # Gather stringer info to speed up searching
-    # fmt: off
-    stringers = {{
-        name: set(e.index for e in stringer.edges)
-        for name, stringer in part.stringers.items()
-    }}
-    # fmt: on
+    stringer_map = _get_stringer_map(part)
+    part_stringers = part.stringers
     for i, mem in enumerate(members):
         edge, pt = edges[i]
         is_stringer = len(edge.getFaces()) > 0
         section_name = "{{}}_{{}}".format(mem["section"], mem["material"])
         if is_stringer:
-            found_stringer = False
-            for stringer_name, stringer_edges in stringers.items():
-                # NOTE: This currently assigns to all edges in a stringer
-                # This is fine where each stringer is only 1 edge but if we want
-                # to group stringers later on, we might need to rethink this
-                if edge.index in stringer_edges:
-                    stringer_assignments[section_name].append(
-                        (stringer_name, part.stringers[stringer_name].edges)
-                    )
-                    found_stringer = True
-                    break
-            assert found_stringer, "Could not find a stringer for this edge"
+            # NOTE: This currently assigns to all edges in a stringer
+            # This is fine where each stringer is only 1 edge but if we want
+            # to group stringers later on, we might need to rethink this
+            assert edge.index in stringer_map, "Could not find a stringer for this edge"
+            stringer_name = stringer_map[edge.index]
+            stringer_assignments[section_name].append(
+                (stringer_name, part_stringers[stringer_name].edges)
+            )
         else:
             edge_assignments[section_name].append(edge.index)
     # Assign non-stringer sections
@@ -330,67 +347,69 @@ def _assign_thicknesses(model, part, data):
         )
 
 
-def _align_edges(part, data):
-    lines = [
-        (m["jointA"]["position"], m["jointB"]["position"])
-        for m in data["members"].values()
-    ]
-    mid_points = [([(i + j) / 2 for i, j in zip(start, end)]) for start, end in lines]
-    # Find all plate edges that are near one of our beams
-    edges = part.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
+def _align_edges(part, lines, edges):
     flip_edges = []
-    for i in edges:
-        edge, pt = edges[i]
+    vertices = part.vertices
+    for i, (edge, pt) in edges.items():
         # Check if the line is the same orientation as in SACS, add to flip list if not
-        e_dir = [end - start for start, end in zip(*_get_edge_ends(part, edge))]
-        l_dir = [end - start for start, end in zip(*lines[i])]
+        e_dir = _vector(*_get_edge_ends(vertices, edge))
+        l_dir = _vector(*lines[i])
         if _dot(e_dir, l_dir) < 0:
             flip_edges.append(edge.index)
     # Flip any edges that are set up in the opposite direction to SACS
-    part.flipTangent(
-        regions=regionToolset.Region(edges=_index_list_to_seq(part.edges, flip_edges))
-    )
+    if flip_edges:
+        part.flipTangent(
+            regions=regionToolset.Region(
+                edges=_index_list_to_seq(part.edges, flip_edges)
+            )
+        )
 
 
-def _assign_beam_orientations(part, data):
+def _assign_beam_orientations(part, members, edges):
     # Gather stringer info to speed up searching
-    # fmt: off
-    stringers = {{
-        name: set(e.index for e in stringer.edges)
-        for name, stringer in part.stringers.items()
-    }}
-    # fmt: on
-    members = list(data["members"].values())
-    lines = [(m["jointA"]["position"], m["jointB"]["position"]) for m in members]
-    mid_points = [([(i + j) / 2 for i, j in zip(start, end)]) for start, end in lines]
-    edges = part.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
-    # Loop through each all members and assign local orientation
+    stringer_map = _get_stringer_map(part)
+    part_stringers = part.stringers
+    # Find the orientation of each edge/stringer. Where members share an edge the
+    # last member wins, as it would when assigning them one by one
+    edge_orientations = dict()
+    stringer_orientations = dict()
     for i, mem in enumerate(members):
         edge, pt = edges[i]
-        section_x = mem["local_y"]
+        section_x = tuple(mem["local_y"])
         is_stringer = len(edge.getFaces()) > 0
         if is_stringer:
-            region = None
-            for stringer_name, stringer_edges in stringers.items():
-                # NOTE: This currently assigns to all edges in a stringer
-                # This is fine where each stringer is only 1 edge but if we want
-                # to group stringers later on, we might need to rethink this
-                if edge.index in stringer_edges:
-                    region = regionToolset.Region(
-                        stringerEdges=[
-                            (
-                                stringer_name,
-                                part.stringers[stringer_name].edges,
-                            )
-                        ]
-                    )
-                    break
-            assert region is not None, "Could not find a stringer for this edge"
+            # NOTE: This currently assigns to all edges in a stringer
+            # This is fine where each stringer is only 1 edge but if we want
+            # to group stringers later on, we might need to rethink this
+            assert edge.index in stringer_map, "Could not find a stringer for this edge"
+            stringer_orientations[stringer_map[edge.index]] = section_x
         else:
-            region = regionToolset.Region(edges=part.edges[edge.index : edge.index + 1])
-
+            edge_orientations[edge.index] = section_x
+    # Group the edges/stringers that share an orientation, so that each orientation
+    # is assigned in one call
+    edge_groups = defaultdict(list)
+    for edge_idx, section_x in edge_orientations.items():
+        edge_groups[section_x].append(edge_idx)
+    stringer_groups = defaultdict(list)
+    for stringer_name, section_x in stringer_orientations.items():
+        stringer_groups[section_x].append(
+            (stringer_name, part_stringers[stringer_name].edges)
+        )
+    # Assign non-stringer orientations
+    for section_x, edge_idxs in edge_groups.items():
         part.assignBeamSectionOrientation(
-            region=region, method=N1_COSINES, n1=section_x
+            region=regionToolset.Region(
+                edges=_index_list_to_seq(part.edges, edge_idxs)
+            ),
+            method=N1_COSINES,
+            n1=section_x,
+        )
+    # Assign stringer orientations
+    for section_x, edge_set in stringer_groups.items():
+        part.assignBeamSectionOrientation(
+            region=regionToolset.Region(stringerEdges=edge_set),
+            method=N1_COSINES,
+            n1=section_x,
         )
 
 
@@ -418,21 +437,17 @@ def _assign_point_masses(part, data):
 
 def _assign_line_masses(part, data):
     # Gather stringer edges
-    stringer_map = dict()
-    for stringer_name, stringer in part.stringers.items():
-        for e in stringer.edges:
-            stringer_map[e.index] = stringer_name
+    stringer_map = _get_stringer_map(part)
     # Gather all line mass assignments
     beam_mass_assignments = defaultdict(list)
     stringer_mass_assignments = defaultdict(list)
     line_masses = [mass for mass in data["masses"] if "beam" in mass]
     members = [data["members"][mass["beam"]] for mass in line_masses]
-    lines = [(m["jointA"]["position"], m["jointB"]["position"]) for m in members]
-    mid_points = [([(i + j) / 2 for i, j in zip(start, end)]) for start, end in lines]
+    lines, mid_points = _get_member_lines(members)
     edges = part.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
     # Categorise the masses into beam and stringers
     for idx, (line, mass) in enumerate(zip(lines, line_masses)):
-        beam_length = _length([j - i for i, j in zip(*line)])
+        beam_length = _length(_vector(*line))
         load_length = mass["load_length"] or (beam_length - mass["start_offset"])
         # Here we calculate the total load across the loaded segment of the beam
         # and redistribute it across the whole beam. Therefore this will not correctly
@@ -467,10 +482,11 @@ def _assign_line_masses(part, data):
             magnitude=line_mass,
             distribution=MASS_PROPORTIONAL,
         )
+    part_edges = part.edges
     for i, (line_mass, edges) in enumerate(stringer_mass_assignments.items()):
         region = regionToolset.Region(
             stringerEdges=[
-                (stringer_name, part.edges[e : e + 1]) for stringer_name, e in edges
+                (stringer_name, part_edges[e : e + 1]) for stringer_name, e in edges
             ]
         )
         # Apply the area mass
@@ -531,15 +547,21 @@ mdb.models["{model_name}"].PartFromGeometryFile(
 
 m = mdb.models["{model_name}"]
 p = m.parts["{part_name}"]
-with open("{intermediate_file}", "r") as f_in:
-    data = json.load(f_in)
+with open("{intermediate_file}", "rb") as f_in:
+    data = json_loads(f_in.read())
+
+# A dict view can be iterated again by each step, so no list copy is needed
+members = data["members"].values()
+lines, mid_points = _get_member_lines(members)
 
 _flip_normals(p, data)
-_generate_wires(p, data)
+_generate_wires(p, lines, mid_points)
 _generate_materials(m, data)
 _generate_sections(m, data)
-_assign_sections(p, data)
+# Now the wires exist, find the edge of every member once for the steps below
+edges = p.edges.getClosest(coordinates=mid_points, searchTolerance=0.1)
+_assign_sections(p, members, edges)
 _assign_thicknesses(m, p, data)
-_align_edges(p, data)
-_assign_beam_orientations(p, data)
+_align_edges(p, lines, edges)
+_assign_beam_orientations(p, members, edges)
 _assign_mass_inertias(p, data)
@@ -2,22 +2,25 @@ import os
 import json
 
 from sacs2abaqus import iges
-from .helpers import OrderJoints
+from .helpers import PlateJointsCrossed
 from .sacs_cards import SacsStructure
 
 
 def write_iges(stru: SacsStructure, filename: str):
     # Only write out the plate elements, wires will be passed in the intermediate file
     writer = iges.Iges()
+    joints = stru.joints
     for plate in stru.plates.values():
-        j1 = stru.joints[plate.jointA]
-        j2 = stru.joints[plate.jointB]
-        j3 = stru.joints[plate.jointC]
+        j1 = joints[plate.jointA]
+        j2 = joints[plate.jointB]
+        j3 = joints[plate.jointC]
         if plate.jointD == "":
             writer.plane([(j.x, j.y, j.z) for j in (j1, j2, j3)])
         else:
-            j4 = stru.joints[plate.jointD]
-            writer.plane([(j.x, j.y, j.z) for j in OrderJoints([j1, j2, j3, j4])])
+            j4 = joints[plate.jointD]
+            if PlateJointsCrossed(j1, j2, j3, j4):
+                j3, j4 = j4, j3
+            writer.plane([(j.x, j.y, j.z) for j in (j1, j2, j3, j4)])
     writer.write(filename)
 
 
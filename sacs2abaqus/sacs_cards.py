@@ -1,14 +1,44 @@
 import copy
 from collections import defaultdict
 import logging
+import sys
 
-from .helpers import memberMap, GetFloat
+from .helpers import memberMap, GetFixity, GetFloat, GetFloats
 from .geom3 import CSys, Vector3
 
 LENGTH_TOL = 1.0e-6
+# Width of a SACS card; shorter lines are treated as blank in the missing columns
+CARD_WIDTH = 80
+# SACS decks can run to hundreds of MB, so read them in large blocks
+READ_BUFFER_SIZE = 1 << 20
+
+# Column spans of the numeric fields read from each fixed-width card
+# SECT: AX, J, IY, IZ, then the dimensions A to E
+SECT_FIELDS = (
+    (18, 24),
+    (24, 32),
+    (32, 40),
+    (40, 48),
+    (49, 55),
+    (55, 60),
+    (60, 66),
+    (66, 71),
+    (71, 76),
+)
+# JOINT: x, y, z coordinates followed by the x, y, z offsets. The ELASTI card
+# uses the same columns for the translational then rotational spring rates
+JOINT_FIELDS = ((11, 18), (18, 25), (25, 32), (32, 39), (39, 46), (46, 53))
+# MEMBER: chord angle, density, number of segments, effective diameter
+MEMBER_FIELDS = ((35, 41), (64, 70), (70, 72), (72, 78))
+# PLATE: thickness, E, Poisson's ratio, yield stress, density
+PLATE_FIELDS = ((32, 38), (47, 54), (54, 59), (59, 64), (69, 74))
+# LOAD (GLOB JOIN): forces then moments about x, y, z
+JOINT_LOAD_FIELDS = ((16, 23), (23, 30), (30, 37), (37, 44), (45, 52), (52, 59))
 
 
 class SECT:
+    __slots__ = ("ID", "sect", "AX", "J", "IY", "IZ", "A", "B", "C", "D", "E", "F")
+
     def _from_grup(self, grup: "GRUP"):
         self.ID = grup.ID
         self.sect = "PIPE"
@@ -28,19 +58,20 @@ class SECT:
         self.ID = l[5:12].strip()
         if l[15:18] in memberMap:
             self.sect = memberMap[l[15:18]]
-            self.AX = GetFloat(l[18:24]) * 1e-4 or None  # Convert cm^2 to m^2
-            self.J = GetFloat(l[24:32]) * 1e-8 or None  # Convert cm^4 to m^4
-            self.IY = GetFloat(l[32:40]) * 1e-8 or None  # Convert cm^4 to m^4
-            self.IZ = GetFloat(l[40:48]) * 1e-8 or None  # Convert cm^4 to m^4
-            self.A = GetFloat(l[49:55]) * 1e-2  # Convert from cm to m
-            self.B = GetFloat(l[55:60]) * 1e-2  # Convert from cm to m
-            self.C = GetFloat(l[60:66]) * 1e-2  # Convert from cm to m
+            AX, J, IY, IZ, A, B, C, D, E = GetFloats(l, SECT_FIELDS)
+            self.AX = AX * 1e-4 or None  # Convert cm^2 to m^2
+            self.J = J * 1e-8 or None  # Convert cm^4 to m^4
+            self.IY = IY * 1e-8 or None  # Convert cm^4 to m^4
+            self.IZ = IZ * 1e-8 or None  # Convert cm^4 to m^4
+            self.A = A * 1e-2  # Convert from cm to m
+            self.B = B * 1e-2  # Convert from cm to m
+            self.C = C * 1e-2  # Convert from cm to m
             if self.sect == "PRI":
-                self.D = GetFloat(l[66:71]) * 1e-4  # Convert from cm^2 to m^2
-                self.E = GetFloat(l[71:76]) * 1e-4  # Convert from cm^2 to m^2
+                self.D = D * 1e-4  # Convert from cm^2 to m^2
+                self.E = E * 1e-4  # Convert from cm^2 to m^2
             else:
-                self.D = GetFloat(l[66:71]) * 1e-2  # Convert from cm to m
-                self.E = GetFloat(l[71:76]) * 1e-2  # Convert from cm to m
+                self.D = D * 1e-2  # Convert from cm to m
+                self.E = E * 1e-2  # Convert from cm to m
             if l[15:18] in ("PLG", "TEE", "CHL", "ANG", "CON"):
                 # These types have additional datum F
                 self.F = GetFloat(l[76:80])
@@ -51,6 +82,12 @@ class SECT:
             self.sect = False
 
     def abaqus_section_defn(self, label: str) -> str:
+        header, data = self.abaqus_section_template()
+        return header.format(label.replace(".", "-")) + data
+
+    def abaqus_section_template(self) -> tuple[str, str]:
+        # Splits the section definition into a header with a {} placeholder for the
+        # member label and the data lines, which are the same for every member
         FUNCTION_MAP = {
             "PIPE": self._abq_PIPE_section,
             "I": self._abq_I_section,
@@ -65,16 +102,14 @@ class SECT:
 
         abq_section = LABEL_MAP.get(self.sect, self.sect)
         if self.sect in GENERAL_SECTIONS:
-            header = "*Beam General Section, elset=M-{}, section={}, material=Mtl-Beam\n".format(
-                label.replace(".", "-"), abq_section
+            header = "*Beam General Section, elset=M-{{}}, section={}, material=Mtl-Beam\n".format(
+                abq_section
             )
         else:
-            header = (
-                "*Beam Section, elset=M-{}, section={}, material=Mtl-Beam\n".format(
-                    label.replace(".", "-"), abq_section
-                )
+            header = "*Beam Section, elset=M-{{}}, section={}, material=Mtl-Beam\n".format(
+                abq_section
             )
-        return header + FUNCTION_MAP[self.sect]()
+        return header, FUNCTION_MAP[self.sect]()
 
     def to_dict(self) -> dict:
         FUNCTION_MAP = {
@@ -222,6 +257,8 @@ class SECT:
 
 class PSTIF(SECT):
     # Section definition for a plate stiffener
+    __slots__ = ()
+
     def __init__(self, line):
         assert line.startswith("PSTIF")
         sacs_section_type = line[6:9].strip()
@@ -260,9 +297,30 @@ class PGRUP:
     # A plate group as defined from SACS
     # Note that this includes the section properties of the plate, as there
     # are no SECT lines for plates.
+    __slots__ = (
+        "ID",
+        "abq_name",
+        "NA",
+        "thickness",
+        "sect",
+        "E",
+        "v",
+        "FY",
+        "Zoffset",
+        "stiffener_section",
+        "stiffener_spacing",
+        "stiffener_direction",
+        "stiffener_placement",
+        "density",
+    )
+
     def __init__(self, l, eltype):
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
         # PLATE sects and groups are defined together on the PGRUP line
         self.ID = l[6:9].strip()
+        # Name used for this group's element set in Abaqus
+        self.abq_name = self.ID.replace(".", "-")
         # Neutral axis offset
         self.NA = l[9]
         # Convert from cm to m
@@ -304,32 +362,56 @@ class PGRUP:
 
 class GRUP:
     # A member group as defined from SACS
+    __slots__ = (
+        "ID",
+        "abq_name",
+        "taper",
+        "section",
+        "redesign",
+        "OD",
+        "thickness",
+        "gap",
+        "E",
+        "G",
+        "FY",
+        "memberClass",
+        "jointThickness",
+        "KY",
+        "KZ",
+        "spacing",
+        "shearMod",
+        "flooding",
+        "density",
+        "segLength",
+    )
+
     def __init__(self, l, eltype):
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
         self.ID = l[5:8].strip()
-        try:
-            if l[8] == " ":
-                self.taper = False
-            else:
-                self.taper = l[8]
-            self.section = l[9:16].strip()
-            self.redesign = l[16]
-            self.OD = GetFloat(l[17:23]) * 1e-2  # Convert from cm to m
-            self.thickness = GetFloat(l[23:29]) * 1e-2  # Convert from cm to m
-            self.gap = l[29]
-            self.E = GetFloat(l[30:35]) * 1e10
-            self.G = GetFloat(l[35:40]) * 1e10
-            self.FY = GetFloat(l[40:45]) * 1e7
-            self.memberClass = l[46]
-            self.jointThickness = GetFloat(l[47:51])
-            self.KY = GetFloat(l[51:55])
-            self.KZ = GetFloat(l[55:59])
-            self.spacing = GetFloat(l[59:64])
-            self.shearMod = GetFloat(l[64:69])
-            self.flooding = l[69]
-            self.density = GetFloat(l[70:76]) * 1e3  # Convert from t/m^3 to kg/m^3
-            self.segLength = GetFloat(l[76:80])
-        except:
-            pass
+        # Name used for this group's element set in Abaqus
+        self.abq_name = self.ID.replace(".", "-")
+        if l[8] == " ":
+            self.taper = False
+        else:
+            self.taper = l[8]
+        self.section = l[9:16].strip()
+        self.redesign = l[16]
+        self.OD = GetFloat(l[17:23]) * 1e-2  # Convert from cm to m
+        self.thickness = GetFloat(l[23:29]) * 1e-2  # Convert from cm to m
+        self.gap = l[29]
+        self.E = GetFloat(l[30:35]) * 1e10
+        self.G = GetFloat(l[35:40]) * 1e10
+        self.FY = GetFloat(l[40:45]) * 1e7
+        self.memberClass = l[46]
+        self.jointThickness = GetFloat(l[47:51])
+        self.KY = GetFloat(l[51:55])
+        self.KZ = GetFloat(l[55:59])
+        self.spacing = GetFloat(l[59:64])
+        self.shearMod = GetFloat(l[64:69])
+        self.flooding = l[69]
+        self.density = GetFloat(l[70:76]) * 1e3  # Convert from t/m^3 to kg/m^3
+        self.segLength = GetFloat(l[76:80])
 
     def to_material_dict(self):
         poisson = self.E / (2 * self.G) - 1
@@ -343,71 +425,126 @@ class GRUP:
 
 class MEMBER:
     # A member as defined from SACS
+    __slots__ = (
+        "offset",
+        "jointA",
+        "jointB",
+        "ID",
+        "abq_name",
+        "vertical",
+        "ABQID",
+        "addData",
+        "group",
+        "stressOutput",
+        "gap",
+        "fixityA",
+        "fixityB",
+        "chordAngle",
+        "Zref",
+        "flood",
+        "KorL",
+        "thickness",
+        "KY",
+        "KZ",
+        "unbracedLength",
+        "density",
+        "segments",
+        "effectiveDiameter",
+    )
+
     def __init__(self, l):
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
         self.offset = l[6]
-        self.jointA = l[7:11].strip()
-        self.jointB = l[11:15].strip()
+        # Joint and group names are repeated across many cards, so intern them to
+        # share one string per name
+        self.jointA = sys.intern(l[7:11].strip())
+        self.jointB = sys.intern(l[11:15].strip())
         self.ID = self.jointA + self.jointB
+        # Name used for this member's element set in Abaqus
+        self.abq_name = self.ID.replace(".", "-")
         self.vertical = False  # Initialise
         self.ABQID = -1  # Initialise
-        try:
-            self.addData = l[15]
-            self.group = l[16:19].strip()
-            self.stressOutput = l[19:21]
-            self.gap = l[21]
-            self.fixityA = [f == "1" for f in l[22:28]]  # True = free, False = fixed
-            self.fixityB = [f == "1" for f in l[28:34]]  # True = free, False = fixed
-            self.chordAngle = GetFloat(l[35:41])
-            self.Zref = l[41:45]
-            self.flood = l[45]
-            self.KorL = l[46]
-            self.thickness = l[47:51]
-            self.KY = l[51:55]
-            self.KZ = l[55:59]
-            self.unbracedLength = l[59:64]
-            self.density = GetFloat(l[64:70]) * 1e3  # Convert from t/m^3 to kg/m^3
-            self.segments = int(GetFloat(l[70:72]))
-            self.effectiveDiameter = GetFloat(l[72:78]) * 1e-2  # Convert from cm to m
-        except:
-            pass
+        self.addData = l[15]
+        self.group = sys.intern(l[16:19].strip())
+        self.stressOutput = l[19:21]
+        self.gap = l[21]
+        # Bitmasks of released DOFs at each end, see is_free
+        self.fixityA = GetFixity(l[22:28])
+        self.fixityB = GetFixity(l[28:34])
+        chordAngle, density, segments, effectiveDiameter = GetFloats(l, MEMBER_FIELDS)
+        self.chordAngle = chordAngle
+        self.Zref = l[41:45]
+        self.flood = l[45]
+        self.KorL = l[46]
+        self.thickness = l[47:51]
+        self.KY = l[51:55]
+        self.KZ = l[55:59]
+        self.unbracedLength = l[59:64]
+        self.density = density * 1e3  # Convert from t/m^3 to kg/m^3
+        self.segments = int(segments)
+        self.effectiveDiameter = effectiveDiameter * 1e-2  # Convert from cm to m
+
+    def is_free(self, end: str, dof: int) -> bool:
+        # True if DOF (0-5) is released at end "A" or "B" of the member
+        return bool((self.fixityA if end == "A" else self.fixityB) & (1 << dof))
 
     def local_csys(self, joints: dict[str, "JOINT"]) -> CSys:
         start = joints[self.jointA].as_vector()
         end = joints[self.jointB].as_vector()
-        beam_csys = CSys.from_beam_ends(start, end)
-        if self.chordAngle:
-            beam_csys = beam_csys.rotated_about_x(self.chordAngle)
-        return beam_csys
+        return CSys.from_beam_ends(start, end, self.chordAngle or 0.0)
 
 
 class PLATE:
     # A plate as defined by SACS; can connect either 3 or 4 joints
+    __slots__ = (
+        "ID",
+        "abq_name",
+        "ABQID",
+        "jointA",
+        "jointB",
+        "jointC",
+        "jointD",
+        "group",
+        "SK",
+        "thickness",
+        "offsetOption",
+        "E",
+        "v",
+        "FY",
+        "density",
+        "remarks",
+    )
+
     def __init__(self, l):
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
         self.ID = l[6:10]
+        # Name used for this plate's element set in Abaqus
+        self.abq_name = self.ID.replace(".", "-")
         self.ABQID = -1  # Initialise
-        try:
-            # NOTE: local coords defined as follows:
-            #  X: joint_b - joint_a
-            #  Y: In the plane of X and (joint_c - joint_a), normal to X
-            #  Z: cross product of X and Y
-            self.jointA = l[11:15].strip()  # SACS IDs of connecting joints
-            self.jointB = l[15:19].strip()
-            self.jointC = l[19:23].strip()
-            self.jointD = l[23:27].strip()  # Stripped so we get '' if no jointD
-            self.group = l[27:30].strip()
-            self.SK = l[30:32]
-            self.thickness = GetFloat(l[32:38]) * 1e-2  # Convert from cm to m
-            self.offsetOption = l[42]  # '1' for global coords, '2' for local
-            # Modulus - convert from 1000 kN/cm^2 to Pa
-            self.E = GetFloat(l[47:54]) * 1e10
-            self.v = GetFloat(l[54:59])  # Poisson's ratio
-            # Yield stress - convert from kN/cm^2 to Pa
-            self.FY = GetFloat(l[59:64]) * 1e7
-            # Seastate weight density - convert from t/m^3 to kg/m^3
-            self.density = GetFloat(l[69:74]) * 1e3
-            self.remarks = l[74:80]
-        except:
-            pass
+        # NOTE: local coords defined as follows:
+        #  X: joint_b - joint_a
+        #  Y: In the plane of X and (joint_c - joint_a), normal to X
+        #  Z: cross product of X and Y
+        # SACS IDs of connecting joints, interned as in MEMBER
+        self.jointA = sys.intern(l[11:15].strip())
+        self.jointB = sys.intern(l[15:19].strip())
+        self.jointC = sys.intern(l[19:23].strip())
+        self.jointD = sys.intern(l[23:27].strip())  # Stripped so we get '' if no jointD
+        self.group = sys.intern(l[27:30].strip())
+        self.SK = l[30:32]
+        thickness, E, v, FY, density = GetFloats(l, PLATE_FIELDS)
+        self.thickness = thickness * 1e-2  # Convert from cm to m
+        self.offsetOption = l[42]  # '1' for global coords, '2' for local
+        # Modulus - convert from 1000 kN/cm^2 to Pa
+        self.E = E * 1e10
+        self.v = v  # Poisson's ratio
+        # Yield stress - convert from kN/cm^2 to Pa
+        self.FY = FY * 1e7
+        # Seastate weight density - convert from t/m^3 to kg/m^3
+        self.density = density * 1e3
+        self.remarks = l[74:80]
 
     def centroid(self, joints: list["JOINT"]) -> Vector3:
         pts = [
@@ -429,6 +566,8 @@ class PLATE:
 
 class LCOMB:
     # Load combinations
+    __slots__ = ("loadcases",)
+
     def __init__(self):
         self.loadcases = []
 
@@ -465,6 +604,8 @@ class LCOMB:
 
 class LOADCASE:
     # Load container
+    __slots__ = ("description", "loads")
+
     def __init__(self):
         self.description = ""
         self.loads = []
@@ -476,21 +617,29 @@ class LOADCASE:
 
 class LOAD:
     # Load line as taken from SACS
+    __slots__ = (
+        "load_type",
+        "load_csys",
+        "type",
+        "joint",
+        "load",
+        "dirn",
+        "beam",
+        "start_offset",
+        "load_length",
+        "plate",
+        "remarks",
+    )
+
     def __init__(self, l):
         self.load_type = l[65:69]
         self.load_csys = l[60:64]
         if self.load_csys == "GLOB":
             if self.load_type == "JOIN":
                 self.type = "joint"
-                self.joint = l[7:11].strip()
-                self.load = []
+                self.joint = sys.intern(l[7:11].strip())
                 # Add forces (convert from kN to N)
-                self.load.append(GetFloat(l[16:23]) * 1e3)
-                self.load.append(GetFloat(l[23:30]) * 1e3)
-                self.load.append(GetFloat(l[30:37]) * 1e3)
-                self.load.append(GetFloat(l[37:44]) * 1e3)
-                self.load.append(GetFloat(l[45:52]) * 1e3)
-                self.load.append(GetFloat(l[52:59]) * 1e3)
+                self.load = [f * 1e3 for f in GetFloats(l, JOINT_LOAD_FIELDS)]
             else:
                 assert self.load_type == "UNIF"
                 self.type = "beam"
@@ -540,31 +689,36 @@ class LOAD:
 
 class Spring:
     # Container for organisation of JOINT Spring parameters
-    pass
+    __slots__ = ("rates", "comments", "joint2", "joint3")
 
 
 class JOINT:
     # A joint as defined from SACS
+    __slots__ = ("ABQID", "ID", "x", "y", "z", "fixity", "remarks", "spring")
+
     def __init__(self, l, abq_n):
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
         self.ABQID = abq_n  # Abaqus node number - integer
-        self.ID = l[6:10].strip()
-        self.x = GetFloat(l[11:18]) + GetFloat(l[32:39]) * 1e-2
-        self.y = GetFloat(l[18:25]) + GetFloat(l[39:46]) * 1e-2
-        self.z = GetFloat(l[25:32]) + GetFloat(l[46:53]) * 1e-2
-        try:
-            self.fixity = [f == "1" for f in l[54:60]]  # true = free, false = fixed
-            self.remarks = l[61:69]
-        except:
-            pass
+        self.ID = sys.intern(l[6:10].strip())
+        x, y, z, dx, dy, dz = GetFloats(l, JOINT_FIELDS)
+        self.x = x + dx * 1e-2
+        self.y = y + dy * 1e-2
+        self.z = z + dz * 1e-2
+        self.fixity = [f == "1" for f in l[54:60]]  # true = free, false = fixed
+        self.remarks = l[61:69]
 
     def Elastic(self, l):
         # If the SACS input has 'ELASTI' in l[54:60] then it's an elastic spring definition
         # and we should add it to the existing JOINT instance
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
         self.spring = Spring()
+        rates = GetFloats(l, JOINT_FIELDS)
         # Convert kg/cm to N/m
-        disp_rates = [GetFloat(x) * 1e3 for x in (l[11:18], l[18:25], l[25:32])]
+        disp_rates = [x * 1e3 for x in rates[:3]]
         # Convert kg.cm/rad to N.m/rad
-        rot_rates = [GetFloat(x) * 0.1 for x in (l[32:39], l[39:46], l[46:53])]
+        rot_rates = [x * 0.1 for x in rates[3:]]
         self.spring.rates = disp_rates + rot_rates  # [dx, dy, dz, rx, ry, rz]
         self.spring.comments = l[61:69]
         # Support coord sys orientation joint. Defines x-axis line.
@@ -584,6 +738,7 @@ class SacsStructure:
     sects: dict[str, SECT] = {}
     joints: dict[str, JOINT] = {}
     nmap: list[tuple[int, str]] = []
+    nmap_merged: list[tuple[int, str, str]] = []
     abq_n = 0
     lcombs: dict[str, LCOMB] = {}
     loadcases: dict[str, LOADCASE] = {}
@@ -596,120 +751,166 @@ class SacsStructure:
         file_list = [input_file] + (
             [secondary_input] if secondary_input is not None else []
         )
+        handlers = SacsStructure._LINE_HANDLERS
         for fname in file_list:
-            with open(fname, "rt") as f_in:
-                lines = f_in.readlines()
-            for l in lines:
-                # Make sure all lines are 80 characters long, extending any shorter ones with spaces
-                l = l.rstrip() + " " * (80 - len(l.rstrip()))
-                if not l.rstrip() == "JOINT" and l[:5] == "JOINT":
-                    # JOINT
-                    if l[54:60] == "ELASTI" and l[6:10] in stru.joints:
-                        # Elastic spring definition
-                        stru.joints[l[6:10]].Elastic(l)
-                    elif l[54:60] == "ELASTI":
-                        # Spring definition before JOINT
-                        print(
-                            "WARNING: A joint spring is defined before its joint is defined! Skipping...\n"
-                        )
-                    else:
-                        # JOINT geometry definition line
-                        stru.abq_n += 1
-                        j = JOINT(l, stru.abq_n)
-                        stru.joints[j.ID] = j
-                        stru.nmap.append((j.ABQID, j.ID))
-                elif (
-                    l[:6] == "MEMBER"
-                    and not l.rstrip() == "MEMBER"
-                    and not l[7:14] == "OFFSETS"
-                ):
-                    # MEMBER
-                    m = MEMBER(l)
-                    stru.members[m.ID] = m
-                elif (
-                    l[:5] == "PLATE"
-                    and not l.rstrip() == "PLATE"
-                    and not l[7:14] == "OFFSETS"
-                ):
-                    # PLATE
-                    p = PLATE(l)
-                    stru.plates[p.ID] = p
-                elif not l.rstrip() == "SECT" and l[:4] == "SECT":
-                    if not l[5:12] in stru.sects:
-                        # Add this section to sects list
-                        s = SECT(l)
-                        stru.sects[s.ID] = s
-                elif not l.strip() == "PSTIF" and l[:5] == "PSTIF":
-                    if not l[10:17].strip() in stru.sects:
-                        s = PSTIF(l)
-                        stru.sects[s.ID] = s
-                elif not l.rstrip() == "GRUP" and l[:4] == "GRUP":
-                    # GROUP
-                    if not l[5:8] in stru.grups:
-                        # First group line for this group
-                        g = GRUP(l, "MEMBER")
-                        if not g.section:
-                            # Section properties defined in GRUP, not SECT.
-                            # Create a section object for this section
-                            s = SECT(g)
-                            stru.sects[s.ID] = s
-                            g.section = s.ID
-                        stru.grups[g.ID] = g
-                elif not l.rstrip() == "PGRUP" and l[:5] == "PGRUP":
-                    # PLATE GROUP
-                    if not l[5:8] in stru.pgrups:
-                        # First group line for this group
-                        pg = PGRUP(l, "PLATE")
-                        stru.pgrups[pg.ID] = pg
-                elif l[:6] == "LOADCN":
-                    # NEW LOAD CASE
-                    stru.load_case = l[7:12].strip()
-                    stru.loadcases[stru.load_case] = LOADCASE()
-                elif l[:6] == "LOADLB":
-                    # LOAD CASE LABEL
-                    stru.loadcases[stru.load_case].description = l[6:80]
-                elif l.strip() != "LOAD" and l[:4] == "LOAD":
-                    load_type = (l[60:64], l[65:69])
-                    if load_type in [
-                        ("GLOB", "JOIN"),
-                        ("GLOB", "UNIF"),
-                        ("PRES", "UNIF"),
-                    ]:
-                        # Point load
-                        stru.loadcases[stru.load_case].AddLoad(l)
-                    else:
-                        print(
-                            "Unknown load type: {} {}".format(
-                                load_type[0], load_type[1]
-                            )
-                        )
-                elif l[:5] == "LCOMB":
-                    # LOAD COMBINATION
-                    lc = l[6:10].strip()
-                    if lc in stru.lcombs:
-                        # Already defined, so just add loads to this load combo
-                        stru.lcombs[lc].AddLoads(l)
-                    else:
-                        # Create new combo instance and populate with this line
-                        stru.lcombs[lc] = LCOMB()
-                        stru.lcombs[lc].AddLoads(l)
+            # Read one line at a time rather than holding the whole deck in memory
+            with open(fname, "rt", buffering=READ_BUFFER_SIZE) as f_in:
+                for l in f_in:
+                    # Only the line ending is removed here. Cards are not padded to
+                    # CARD_WIDTH up front; the few readers that index or keep columns
+                    # past the end of a short line pad it themselves
+                    l = l.rstrip("\r\n")
+                    # Card keywords are 4 to 6 characters long. Try the longest first
+                    # so that e.g. LOADCN is not treated as a LOAD card
+                    handler = (
+                        handlers.get(l[:6])
+                        or handlers.get(l[:5])
+                        or handlers.get(l[:4])
+                    )
+                    if handler is not None:
+                        handler(stru, l)
         return stru
 
+    # region LINE_HANDLERS
+    def _parse_joint(self, l: str) -> None:
+        if l.rstrip() == "JOINT":
+            return
+        if l.startswith("ELASTI", 54):
+            if l[6:10] in self.joints:
+                # Elastic spring definition
+                self.joints[l[6:10]].Elastic(l)
+            else:
+                # Spring definition before JOINT
+                print(
+                    "WARNING: A joint spring is defined before its joint is defined! Skipping...\n"
+                )
+        else:
+            # JOINT geometry definition line
+            self.abq_n += 1
+            j = JOINT(l, self.abq_n)
+            self.joints[j.ID] = j
+            self.nmap.append((j.ABQID, j.ID))
+
+    def _parse_member(self, l: str) -> None:
+        if l.rstrip() == "MEMBER" or l.startswith("OFFSETS", 7):
+            return
+        m = MEMBER(l)
+        self.members[m.ID] = m
+
+    def _parse_plate(self, l: str) -> None:
+        if l.rstrip() == "PLATE" or l.startswith("OFFSETS", 7):
+            return
+        p = PLATE(l)
+        self.plates[p.ID] = p
+
+    def _parse_sect(self, l: str) -> None:
+        if l.rstrip() == "SECT":
+            return
+        if not l[5:12] in self.sects:
+            # Add this section to sects list
+            s = SECT(l)
+            self.sects[s.ID] = s
+
+    def _parse_pstif(self, l: str) -> None:
+        if l.strip() == "PSTIF":
+            return
+        if not l[10:17].strip() in self.sects:
+            s = PSTIF(l)
+            self.sects[s.ID] = s
+
+    def _parse_grup(self, l: str) -> None:
+        if l.rstrip() == "GRUP":
+            return
+        if not l[5:8] in self.grups:
+            # First group line for this group
+            g = GRUP(l, "MEMBER")
+            if not g.section:
+                # Section properties defined in GRUP, not SECT.
+                # Create a section object for this section
+                s = SECT(g)
+                self.sects[s.ID] = s
+                g.section = s.ID
+            self.grups[g.ID] = g
+
+    def _parse_pgrup(self, l: str) -> None:
+        if l.rstrip() == "PGRUP":
+            return
+        if not l[5:8] in self.pgrups:
+            # First group line for this group
+            pg = PGRUP(l, "PLATE")
+            self.pgrups[pg.ID] = pg
+
+    def _parse_loadcn(self, l: str) -> None:
+        # NEW LOAD CASE
+        self.load_case = l[7:12].strip()
+        self.loadcases[self.load_case] = LOADCASE()
+
+    def _parse_loadlb(self, l: str) -> None:
+        # LOAD CASE LABEL
+        if len(l) < CARD_WIDTH:
+            l = l.ljust(CARD_WIDTH)
+        self.loadcases[self.load_case].description = l[6:80]
+
+    def _parse_load(self, l: str) -> None:
+        if l.strip() == "LOAD":
+            return
+        load_type = (l[60:64], l[65:69])
+        if load_type in [
+            ("GLOB", "JOIN"),
+            ("GLOB", "UNIF"),
+            ("PRES", "UNIF"),
+        ]:
+            # Point load
+            self.loadcases[self.load_case].AddLoad(l)
+        else:
+            print("Unknown load type: {} {}".format(load_type[0], load_type[1]))
+
+    def _parse_lcomb(self, l: str) -> None:
+        # LOAD COMBINATION
+        lc = l[6:10].strip()
+        if lc in self.lcombs:
+            # Already defined, so just add loads to this load combo
+            self.lcombs[lc].AddLoads(l)
+        else:
+            # Create new combo instance and populate with this line
+            self.lcombs[lc] = LCOMB()
+            self.lcombs[lc].AddLoads(l)
+
+    _LINE_HANDLERS = {
+        "JOINT": _parse_joint,
+        "MEMBER": _parse_member,
+        "PLATE": _parse_plate,
+        "SECT": _parse_sect,
+        "PSTIF": _parse_pstif,
+        "GRUP": _parse_grup,
+        "PGRUP": _parse_pgrup,
+        "LOADCN": _parse_loadcn,
+        "LOADLB": _parse_loadlb,
+        "LOAD": _parse_load,
+        "LCOMB": _parse_lcomb,
+    }
+    # endregion
+
     def merge_small_members(self) -> None:
         strip_count = 0
-        for m in self.members.keys():
-            jA = self.joints[self.members[m].jointA].as_vector()
-            jB = self.joints[self.members[m].jointB].as_vector()
-            if (jA - jB).length() < LENGTH_TOL:
+        joints = self.joints
+        # Compare squared lengths so no square root is needed per member
+        tol_sq = LENGTH_TOL * LENGTH_TOL
+        for m in self.members.values():
+            jA = joints[m.jointA]
+            jB = joints[m.jointB]
+            dx = jA.x - jB.x
+            dy = jA.y - jB.y
+            dz = jA.z - jB.z
+            if dx * dx + dy * dy + dz * dz < tol_sq:
                 strip_count += 1
                 # Merge the end joints of this member to retain continuity in the model
-                # and record the merge in the nmap list
-                self.nmap[self.joints[self.members[m].jointB].ABQID - 1].append(
-                    "MERGED WITH {}".format(self.joints[self.members[m].jointA].ABQID)
-                )
-                self.joints[self.members[m].jointB].ABQID = self.joints[
-                    self.members[m].jointA
-                ].ABQID
+                # and record the merge in the nmap_merged list
+                if jB.ABQID != jA.ABQID:
+                    self.nmap_merged.append(
+                        (jB.ABQID, jB.ID, "MERGED WITH {}".format(jA.ABQID))
+                    )
+                    jB.ABQID = jA.ABQID
         print("\n {} members were removed.".format(strip_count))
 
     def to_dict(self, mass_loadcase: str = None):
@@ -738,29 +939,30 @@ class SacsStructure:
             f"Material_{i + 1}": {"youngs": e, "poisson": v, "yield": fy, "density": rho}
             for i, (e, v, fy, rho) in enumerate(materials.keys())
         }
-        members = {
-            name: {
+        # Each element's local CSys is only computed once for all three axes
+        members = {}
+        for name, mem in self.members.items():
+            csys = mem.local_csys(self.joints)
+            members[name] = {
                 "jointA": joints[mem.jointA],
                 "jointB": joints[mem.jointB],
                 "section": self.grups[mem.group].section,
-                "local_x": mem.local_csys(self.joints).x.as_tuple(),
-                "local_y": mem.local_csys(self.joints).y.as_tuple(),
-                "local_z": mem.local_csys(self.joints).z.as_tuple(),
+                "local_x": csys.x.as_tuple(),
+                "local_y": csys.y.as_tuple(),
+                "local_z": csys.z.as_tuple(),
                 "material": material_map[mem.group]
             }
-            for name, mem in self.members.items()
-        }
-        plates = {
-            name: {
+        plates = {}
+        for name, pl in self.plates.items():
+            csys = pl.local_csys(self.joints)
+            plates[name] = {
                 "centroid": pl.centroid(self.joints).as_tuple(),
                 "thickness": round(self.pgrups[pl.group].thickness, 5),
-                "local_x": pl.local_csys(self.joints).x.as_tuple(),
-                "local_y": pl.local_csys(self.joints).y.as_tuple(),
-                "local_z": pl.local_csys(self.joints).z.as_tuple(),
+                "local_x": csys.x.as_tuple(),
+                "local_y": csys.y.as_tuple(),
+                "local_z": csys.z.as_tuple(),
                 "material": material_map[pl.group]
             }
-            for name, pl in self.plates.items()
-        }
         profiles = {name: sect.to_dict() for name, sect in self.sects.items()}
         if mass_loadcase is not None:
             masses = [
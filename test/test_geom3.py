@@ -59,3 +59,19 @@ def test_beamcsys_rotate():
     c = CSys(Vector3(1, 0, 0), Vector3(0, 0, 1), Vector3(0, -1, 0))
     assert a.rotated_about_x(45) == b
     assert a.rotated_about_x(90) == c
+
+
+def test_beamcsys_from_beam_ends():
+    horizontal = CSys.from_beam_ends(Vector3(1, 1, 1), Vector3(4, 1, 1))
+    assert horizontal == CSys(Vector3(1, 0, 0), Vector3(0, 1, 0), Vector3(0, 0, 1))
+    vertical = CSys.from_beam_ends(Vector3(0, 0, 0), Vector3(0, 0, 5))
+    assert vertical == CSys(Vector3(0, 0, 1), Vector3(1, 0, 0), Vector3(0, 1, 0))
+    for axis in (horizontal.x, horizontal.y, horizontal.z, vertical.y):
+        assert axis.length() == pytest.approx(1)
+
+
+def test_beamcsys_from_beam_ends_rotated():
+    start = Vector3(1, 2, 3)
+    end = Vector3(4, -1, 5)
+    expected = CSys.from_beam_ends(start, end).rotated_about_x(30)
+    assert CSys.from_beam_ends(start, end, 30) == expected
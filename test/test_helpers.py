@@ -0,0 +1,54 @@
+import pytest
+
+from sacs2abaqus.geom3 import Vector3
+from sacs2abaqus.helpers import (
+    GetFixity,
+    GetFloat,
+    GetFloats,
+    OrderJoints,
+    PlateJointsCrossed,
+)
+
+
+def test_getfloat():
+    assert GetFloat("  12.5 ") == 12.5
+    assert GetFloat("-3.25") == -3.25
+    assert GetFloat("") is False
+    assert GetFloat("abc") is False
+
+
+def test_getfloat_sacs_exponent():
+    assert GetFloat("1.25-2") == pytest.approx(1.25e-2)
+    assert GetFloat("-1.25-2") == pytest.approx(-1.25e-2)
+    assert GetFloat("1.25e-2") == pytest.approx(1.25e-2)
+    assert GetFloat(" -2.-3 ") == pytest.approx(-2e-3)
+
+
+def test_getfloats():
+    line = "JOINT 0001   1.00  -2.50 1.25-2"
+    assert GetFloats(line, ((11, 18), (18, 25), (25, 32), (32, 39))) == [
+        1.0,
+        -2.5,
+        pytest.approx(1.25e-2),
+        False,
+    ]
+
+
+def test_getfixity():
+    assert GetFixity("000000") == 0
+    assert GetFixity("      ") == 0
+    assert GetFixity("111111") == 0b111111
+    assert GetFixity("100001") == 0b100001
+    assert GetFixity("000111") == 0b111000
+
+
+def test_plate_joints_crossed():
+    a, b, c, d = (
+        Vector3(0, 0, 0),
+        Vector3(1, 0, 0),
+        Vector3(1, 1, 0),
+        Vector3(0, 1, 0),
+    )
+    assert not PlateJointsCrossed(a, b, c, d)
+    assert PlateJointsCrossed(a, b, d, c)
+    assert OrderJoints([a, b, d, c]) == [a, b, c, d]
@@ -0,0 +1,15 @@
+from sacs2abaqus.iges import Iges
+
+
+def test_update_wraps_parameters():
+    writer = Iges()
+    writer.update("P", ["{:010d}".format(i) for i in range(7)], index=3)
+    lines = writer.buffer["P"]
+    assert len(lines) == 2
+    # Each wrapped line ends with a single delimiter and the last with ";"
+    assert (
+        lines[0][:64].rstrip() == ",".join("{:010d}".format(i) for i in range(5)) + ","
+    )
+    assert lines[1][:64].rstrip() == "0000000005,0000000006;"
+    assert all(len(l) == 81 for l in lines)
+    assert lines[1].endswith("3P      2\n")
@@ -0,0 +1,36 @@
+import pytest
+
+from sacs2abaqus.sacs_cards import JOINT, MEMBER, PGRUP, SECT
+
+
+def test_member_short_line():
+    m = MEMBER("MEMBER 00010002 W01")
+    assert m.ID == "00010002"
+    assert m.group == "W01"
+    assert m.fixityA == 0
+    assert m.chordAngle is False
+
+
+def test_joint():
+    j = JOINT("JOINT 0001   1.00  -2.50  10.00  25.00", 7)
+    assert j.ABQID == 7
+    assert j.ID == "0001"
+    assert (j.x, j.y, j.z) == (1.25, -2.5, 10.0)
+
+
+def test_sect_section_template():
+    l = "SECT W12X26    WF " + " " * 31 + "  16.5 0.98  31.0 0.58"
+    s = SECT(l.ljust(80))
+    assert s.sect == "I"
+    header, data = s.abaqus_section_template()
+    assert header == "*Beam Section, elset=M-{}, section=I, material=Mtl-Beam\n"
+    assert s.abaqus_section_defn("0001.02") == header.format("0001-02") + data
+
+
+def test_pgrup_short_line():
+    pg = PGRUP("PGRUP PL1N   1.7I20.0000.300035.500", "PLATE")
+    assert pg.ID == "PL1"
+    assert pg.thickness == pytest.approx(0.017)
+    assert pg.v == pytest.approx(0.3)
+    assert pg.stiffener_section is None
+    assert pg.density == 0.0